@@ -1 +1,8 @@
-from . import library_book, library_rent, library_author, library_wizard
+from . import (
+    library_constraint_mixin,
+    library_name_norm_mixin,
+    library_book,
+    library_rent,
+    library_author,
+    library_wizard,
+)
@@ -1,5 +1,4 @@
-from odoo import models, fields, api
-from odoo.exceptions import ValidationError
+from odoo import models, fields
 
 
 class LibraryAuthor(models.Model):
@@ -9,63 +8,31 @@ class LibraryAuthor(models.Model):
     """
 
     _name = "library.author"
+    _inherit = ["library.constraint.mixin", "library.name.norm.mixin"]
     _description = "Library Author"
     _order = "name"
+    # Normalized-name uniqueness is a single B-tree lookup inside the INSERT/UPDATE
+    # (no Python constraint: PostgreSQL enforces it atomically)
+    _unique_indexes = {
+        "library_author_name_norm_uidx": (["name_norm"], ""),
+    }
+    _db_constraint_messages = {
+        "library_author_name_norm_uidx": "Author already exists "
+        "(names are compared case-insensitive, ignoring extra spaces).",
+    }
+    # Checked by PostgreSQL inside the INSERT/UPDATE; the upper limit
+    # is already enforced by size=100
+    _sql_constraints = [
+        (
+            "name_min_length",
+            "CHECK (char_length(name_norm) >= 2)",
+            "Author name must be at least 2 characters long "
+            "(after removing extra spaces).",
+        ),
+    ]
 
     name = fields.Char(
         string="Author Name",
         required=True,
         size=100,
     )
-
-    @api.constrains("name")
-    def _check_unique_name_normalized(self) -> None:
-        """
-        Ensure author names are unique when compared case-insensitively
-        and ignoring leading/trailing spaces.
-
-        This constraint searches using case-insensitive match on the original name
-        field to avoid timing issues with the stored computed field.
-        """
-
-        for record in self:
-            if not record.name:
-                continue
-            normalized = record.name.strip().lower()
-            if not normalized:
-                continue
-
-            # Search for duplicates using case-insensitive exact match
-            duplicate = self.with_context(active_test=False).search(
-                [
-                    ("name", "=ilike", normalized),
-                    ("id", "!=", record.id),
-                ],
-                limit=1,
-            )
-
-            if duplicate:
-                raise ValidationError(
-                    f"Author '{record.name}' already exists "
-                    "(names are compared case-insensitive, ignoring extra spaces)."
-                )
-
-    @api.constrains("name")
-    def _check_name_length(self) -> None:
-        """
-        Validate that the author name is between 2 and 100 characters long
-        after removing leading/trailing spaces.
-        """
-        for record in self:
-            if not record.name:
-                continue
-
-            cleaned = record.name.strip()
-            length = len(cleaned)
-
-            if length < 2:
-                raise ValidationError(
-                    "Author name must be at least 2 characters long "
-                    "(after removing extra spaces)."
-                )
-            # No need to check upper limit here — size=100 is enforced by DB
@@ -1,5 +1,8 @@
+from collections import defaultdict
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
 
 
 class LibraryBook(models.Model):
@@ -9,8 +12,32 @@ class LibraryBook(models.Model):
     """
 
     _name = "library.book"
+    _inherit = ["library.constraint.mixin", "library.name.norm.mixin"]
     _description = "Library Book"
     _order = "name"  # Default sorting in lists
+    # (normalized title, author) uniqueness is checked by an index probe on write
+    _unique_indexes = {
+        "library_book_name_norm_author_uidx": (["name_norm", "author_id"], ""),
+    }
+    _db_constraint_messages = {
+        "library_book_name_norm_author_uidx": "A book with this title by this author "
+        "already exists.",
+    }
+    # Row-level rules checked by PostgreSQL inside the INSERT/UPDATE
+    _sql_constraints = [
+        (
+            "name_min_length",
+            "CHECK (char_length(name_norm) >= 2)",
+            "Book name must be at least 2 characters long "
+            "(after removing extra spaces).",
+        ),
+        (
+            "published_not_future",
+            "CHECK (published_date IS NULL "
+            "OR published_date <= (now() AT TIME ZONE 'UTC')::date)",
+            "Published date cannot be in the future.",
+        ),
+    ]
 
     name = fields.Char(string="Book Name", required=True, size=50)
 
@@ -22,6 +49,7 @@ class LibraryBook(models.Model):
         "library.author",
         string="Author",
         required=True,
+        index=True,
         ondelete="restrict",
         # These options prevent quick-creation / quick-editing from this field
         options={"no_create": True, "no_open": True},
@@ -38,11 +66,15 @@ class LibraryBook(models.Model):
     )
 
     # New: Current active renter (computed Many2one)
+    # Stored and indexed: only recomputed for books whose rents change,
+    # and searchable without joining library_rent
     current_renter_id = fields.Many2one(
         "res.partner",
         string="Current Renter",
         compute="_compute_current_renter",
-        store=False,
+        store=True,
+        index=True,
+        copy=False,
         readonly=True,
         help="Partner who currently rents this book (if any)",
     )
@@ -52,23 +84,42 @@ class LibraryBook(models.Model):
         string="Available",
         compute="_compute_is_available",
         store=True,  # Allows using this field in filters, domains, search views
+        index=True,  # Backs the [('is_available', '=', True)] rent domain
+        copy=False,
         default=True,
         readonly=True,
     )
 
     # COMPUTE METHODS
 
-    @api.depends("rent_ids", "rent_ids.return_date")
+    @api.depends("rent_ids.return_date")
     def _compute_is_available(self) -> None:
         """
         Book is available when it has no open (not returned) rental records.
+
+        Books with open rents are fetched for the whole recordset with one
+        query served by the partial unique index on open rents, so rent
+        history is never loaded into the ORM cache.
         """
 
+        self.env["library.rent"].flush_model(["book_id", "return_date"])
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT book_id
+                  FROM library_rent
+                 WHERE book_id = ANY(%s) AND return_date IS NULL
+              GROUP BY book_id
+                """,
+                self.ids,
+            )
+        )
+        rented_ids = {book_id for [book_id] in self.env.cr.fetchall()}
+
         for book in self:
-            open_rents = book.rent_ids.filtered(lambda r: not r.return_date)
-            book.is_available = len(open_rents) == 0
+            book.is_available = book.id not in rented_ids
 
-    @api.depends("rent_ids.partner_id", "rent_ids.return_date")
+    @api.depends("rent_ids.partner_id", "rent_ids.rent_date", "rent_ids.return_date")
     def _compute_current_renter(self) -> None:
         """
         Computes the current renter of the book.
@@ -77,19 +128,71 @@ class LibraryBook(models.Model):
         - If one open rent → that partner is the current renter
         - If multiple open rents exist (should never happen due to constraint) →
         takes the most recent one based on rent_date
+
+        The latest open rent of every book is picked by PostgreSQL in one
+        DISTINCT ON query, so no rent record is loaded into the ORM cache.
         """
 
+        self.env["library.rent"].flush_model(
+            ["book_id", "partner_id", "rent_date", "return_date"]
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT DISTINCT ON (book_id) book_id, partner_id
+                  FROM library_rent
+                 WHERE book_id = ANY(%s) AND return_date IS NULL
+              ORDER BY book_id, rent_date DESC NULLS LAST
+                """,
+                self.ids,
+            )
+        )
+        renter_ids = dict(self.env.cr.fetchall())
+
         for book in self:
-            open_rents = book.rent_ids.filtered(lambda r: not r.return_date)
+            book.current_renter_id = renter_ids.get(book.id, False)
 
-            if not open_rents:
-                book.current_renter_id = False
-                continue
+    @api.model
+    def _refresh_availability(self, book_ids: list[int] | None = None) -> None:
+        """
+        Recomputes the stored is_available / current_renter_id columns of the
+        given books (all books when book_ids is None) with one UPDATE, without
+        loading anything into the ORM cache.
 
-            latest = open_rents.sorted(
-                key=lambda r: r.rent_date or fields.Date.today(), reverse=True
-            )[:1]
-            book.current_renter_id = latest.partner_id
+        Meant for code writing library_rent rows outside the ORM (bulk loads,
+        repairs); regular ORM writes keep both fields up to date on their own.
+        """
+
+        self.env["library.rent"].flush_model(
+            ["book_id", "partner_id", "rent_date", "return_date"]
+        )
+        self.flush_model(["is_available", "current_renter_id"])
+        self.env.cr.execute(
+            SQL(
+                """
+                UPDATE library_book b
+                   SET is_available = NOT EXISTS (
+                           SELECT 1
+                             FROM library_rent r
+                            WHERE r.book_id = b.id AND r.return_date IS NULL
+                       ),
+                       current_renter_id = (
+                           SELECT r.partner_id
+                             FROM library_rent r
+                            WHERE r.book_id = b.id AND r.return_date IS NULL
+                         ORDER BY r.rent_date DESC NULLS LAST
+                            LIMIT 1
+                       )
+                 %s
+                """,
+                (
+                    SQL("WHERE b.id = ANY(%s)", book_ids)
+                    if book_ids is not None
+                    else SQL()
+                ),
+            )
+        )
+        self.invalidate_model(["is_available", "current_renter_id"])
 
     # CONSTRAINTS
 
@@ -98,52 +201,46 @@ class LibraryBook(models.Model):
         """
         Ensures that the combination of book title + author is unique.
         Case-insensitive comparison + strip whitespace.
+
+        Mostly a fallback for the unique index declared in _unique_indexes:
+        duplicates within the recordset are detected in memory, then possible
+        duplicates in the database are fetched with one grouped query on the
+        indexed normalized title.
         """
 
+        # Duplicates inside the batch itself are caught in memory first,
+        # before any query is issued. Only multi-record write() gets here with
+        # such duplicates: on create() the INSERT already hits the unique index
+        batch_keys: defaultdict[tuple[int, str], list] = defaultdict(list)
         for record in self:
-            if not record.name or not record.author_id:
-                continue
-
-            duplicate = self.search(
-                [
-                    ("name", "=ilike", record.name.strip()),
-                    ("author_id", "=", record.author_id.id),
-                    ("id", "!=", record.id),
-                ],
-                limit=1,
-            )
-
-            if duplicate:
+            if record.name and record.author_id:
+                batch_keys[(record.author_id.id, record.name_norm)].append(record)
+        for records in batch_keys.values():
+            if len(records) > 1:
                 raise ValidationError(
-                    f"A book titled '{record.name}' by '{record.author_id.name}' already exists."
+                    f"A book titled '{records[0].name}' by "
+                    f"'{records[0].author_id.name}' is listed more than once."
                 )
 
-    @api.constrains("published_date")
-    def _check_published_date_not_future(self) -> None:
-        """Published date cannot be in the future."""
+        groups = self._read_group(
+            domain=[
+                ("author_id", "in", self.author_id.ids),
+                ("name_norm", "in", list(set(self.mapped("name_norm")))),
+            ],
+            groupby=["author_id", "name_norm"],
+            aggregates=["id:array_agg"],
+        )
+        ids_by_key = {
+            (author.id, name_norm): set(book_ids)
+            for author, name_norm, book_ids in groups
+        }
 
-        today = fields.Date.today()
         for record in self:
-            if record.published_date and record.published_date > today:
-                raise ValidationError("Published date cannot be in the future.")
-
-    @api.constrains("name")
-    def _check_name_length(self) -> None:
-        """
-        Validate that the book name is between 2 and 50 characters long
-        after removing leading/trailing spaces.
-        """
-
-        for record in self:
-            if not record.name:
+            if not record.name or not record.author_id:
                 continue
 
-            cleaned = record.name.strip()
-            length = len(cleaned)
-
-            if length < 2:
+            key = (record.author_id.id, record.name_norm)
+            if ids_by_key.get(key, set()) - {record.id}:
                 raise ValidationError(
-                    "Book name must be at least 2 characters long "
-                    "(after removing extra spaces)."
+                    f"A book titled '{record.name}' by '{record.author_id.name}' already exists."
                 )
-            # No need to check upper limit here — size=50 is enforced by DB
@@ -0,0 +1,185 @@
+import logging
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+import psycopg2
+from psycopg2 import IntegrityError
+
+from odoo import models, api, tools
+from odoo.exceptions import ValidationError
+from odoo.tools import SQL
+from odoo.tools.sql import index_exists
+
+_logger = logging.getLogger(__name__)
+
+
+class LibraryConstraintMixin(models.AbstractModel):
+    """
+    Mixin for models whose invariants are enforced by PostgreSQL
+    (unique indexes, CHECK constraints).
+    Creates the declared unique indexes and translates violations of known
+    DB constraints into ValidationError, so users get the same friendly
+    message as from a Python constraint.
+    """
+
+    _name = "library.constraint.mixin"
+    _description = "Library DB Constraint Mixin"
+
+    # Unique index name -> (indexed expressions, optional partial-index WHERE clause)
+    _unique_indexes: dict[str, tuple[list[str], str]] = {}
+
+    # DB constraint / unique index name -> message shown when it is violated
+    # (messages of _sql_constraints are picked up automatically)
+    _db_constraint_messages: dict[str, str] = {}
+
+    def init(self) -> None:
+        super().init()
+
+        missing_indexes = {
+            index_name: definition
+            for index_name, definition in self._unique_indexes.items()
+            if not index_exists(self.env.cr, index_name)
+        }
+        if not missing_indexes:
+            return
+
+        # A stored computed column added by this upgrade is still NULL here:
+        # _auto_init() only queues its computation, flushed at the very end of
+        # the upgrade. Compute the columns used by the indexes first, so rows
+        # violating an index are reported below instead of aborting that flush
+        fnames = self._fnames_in(
+            " ".join([*expressions, where])
+            for expressions, where in missing_indexes.values()
+        )
+        for fname in fnames:
+            field = self._fields[fname]
+            if field.compute and field.store:
+                records = self.with_context(active_test=False).search(
+                    [(fname, "=", False)]
+                )
+                self.env.add_to_compute(field, records)
+        self.flush_model(list(fnames))
+
+        for index_name, (expressions, where) in missing_indexes.items():
+            # Like _sql_constraints: existing rows violating the index must not
+            # abort the module upgrade, they are reported instead
+            try:
+                with self.env.cr.savepoint(flush=False):
+                    self.env.cr.execute(
+                        SQL(
+                            "CREATE UNIQUE INDEX %s ON %s (%s)%s",
+                            SQL.identifier(index_name),
+                            SQL.identifier(self._table),
+                            SQL(", ".join(expressions)),
+                            SQL(" WHERE %s", SQL(where)) if where else SQL(),
+                        ),
+                        log_exceptions=False,
+                    )
+            except psycopg2.Error as error:
+                _logger.warning(
+                    "Unable to create unique index %s on table %s, existing rows "
+                    "violate it (%s). Fix the data and upgrade the module again.",
+                    index_name,
+                    self._table,
+                    error,
+                )
+
+    @api.model_create_multi
+    def create(self, vals_list: list[dict[str, Any]]) -> models.Model:
+        # The INSERT runs inside create() itself, no flush is needed to catch it
+        get_name = None
+        if self._rec_name and len(vals_list) == 1:
+            get_name = lambda: vals_list[0].get(self._rec_name)  # noqa: E731
+        with self._db_constraint_as_validation_error(get_name):
+            return super().create(vals_list)
+
+    def write(self, vals: dict[str, Any]) -> bool:
+        # Writes that cannot violate a DB constraint keep the ORM's deferred,
+        # batched UPDATEs: no savepoint, no flush
+        if not vals.keys() & self._db_constrained_fnames():
+            return super().write(vals)
+
+        get_name = None
+        if self._rec_name and len(self) == 1:
+            get_name = lambda: self[self._rec_name]  # noqa: E731
+        with self._db_constraint_as_validation_error(get_name, rolled_back=self):
+            result = super().write(vals)
+            # Run the UPDATE of these records now, so violations surface here
+            self.flush_recordset()
+        return result
+
+    @tools.ormcache()
+    def _db_constrained_fnames(self) -> frozenset[str]:
+        """
+        Fields whose values can violate one of the model's DB constraints:
+        fields named in _unique_indexes / _sql_constraints, plus the fields
+        the computed ones among them depend on.
+        """
+
+        sources = [
+            " ".join([*expressions, where])
+            for expressions, where in self._unique_indexes.values()
+        ]
+        sources += [definition for _key, definition, _message in self._sql_constraints]
+        fnames = self._fnames_in(sources)
+        for fname in list(fnames):
+            field = self._fields[fname]
+            if field.compute:
+                depends, _depends_context = field.get_depends(self)
+                fnames.update(path.split(".")[0] for path in depends)
+        return frozenset(fnames)
+
+    def _fnames_in(self, sources: Iterable[str]) -> set[str]:
+        """Names of this model's fields appearing in the given SQL snippets."""
+
+        return {
+            word
+            for source in sources
+            for word in re.findall(r"\w+", source)
+            if word in self._fields
+        }
+
+    @contextmanager
+    def _db_constraint_as_validation_error(
+        self,
+        get_name: Callable[[], str | None] | None = None,
+        rolled_back: models.Model | None = None,
+    ) -> Iterator[None]:
+        """
+        Run the wrapped SQL in a savepoint, so a violation can be rolled back,
+        then re-raise known violations as ValidationError.
+        get_name returns the name of the offending record when a single record
+        is involved; for batches no name is given, as the failing row is unknown.
+        rolled_back holds the existing records whose UPDATE may be rolled back:
+        their cached values are discarded, the rest of the cache is kept.
+        """
+
+        try:
+            with self.env.cr.savepoint(flush=False):
+                yield
+        except IntegrityError as error:
+            name = get_name() if get_name else None
+            # Created rows never reach the caller, only updated ones are stale
+            if rolled_back is not None:
+                rolled_back.invalidate_recordset(flush=False)
+            message = self._get_db_constraint_message(error.diag.constraint_name)
+            if not message:
+                raise
+            if name:
+                message = f"{message}\nOffending record: {name}"
+            raise ValidationError(message) from error
+
+    def _get_db_constraint_message(self, constraint_name: str | None) -> str | None:
+        """
+        Message for a violated DB constraint owned by this model: either listed
+        in _db_constraint_messages or declared in _sql_constraints (which Odoo
+        names "<table>_<key>").
+        """
+
+        if constraint_name in self._db_constraint_messages:
+            return self._db_constraint_messages[constraint_name]
+        for key, _definition, message in self._sql_constraints:
+            if constraint_name == f"{self._table}_{key}":
+                return message
+        return None
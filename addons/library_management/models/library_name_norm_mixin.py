@@ -0,0 +1,25 @@
+from odoo import models, fields, api
+
+
+class LibraryNameNormMixin(models.AbstractModel):
+    """
+    Adds a stored, lowercased and stripped copy of the record name, so
+    case-insensitive comparisons of names are plain indexed equalities.
+    """
+
+    _name = "library.name.norm.mixin"
+    _description = "Library Normalized Name Mixin"
+
+    # Not indexed on its own: the inheriting models' unique indexes
+    # start with name_norm and serve lookups on it
+    name_norm = fields.Char(
+        string="Normalized Name",
+        compute="_compute_name_norm",
+        store=True,
+        precompute=True,
+    )
+
+    @api.depends("name")
+    def _compute_name_norm(self) -> None:
+        for record in self:
+            record.name_norm = (record.name or "").strip().lower()
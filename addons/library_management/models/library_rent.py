@@ -1,3 +1,7 @@
+from collections import Counter
+
+from psycopg2.extras import execute_values
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
 from typing import Any
@@ -10,13 +14,34 @@ class LibraryRent(models.Model):
     """
 
     _name = "library.rent"
+    _inherit = ["library.constraint.mixin"]
     _description = "Library Rent"
     _order = "rent_date desc, return_date desc"
+    # At most one open rent per book, enforced atomically by PostgreSQL
+    _unique_indexes = {
+        "library_rent_one_open": (["book_id"], "return_date IS NULL"),
+    }
+    _db_constraint_messages = {
+        "library_rent_one_open": "This book is already rented and not returned.",
+    }
+    # Date rules checked by PostgreSQL on every row write. Dates in the past
+    # stay valid as time goes by, so using the current date here is safe
+    _sql_constraints = [
+        (
+            "dates_ck",
+            "CHECK (rent_date <= (now() AT TIME ZONE 'UTC')::date "
+            "AND (return_date IS NULL OR (return_date >= rent_date "
+            "AND return_date <= (now() AT TIME ZONE 'UTC')::date)))",
+            "Rent and return dates cannot be in the future, "
+            "and the return date cannot be earlier than the rent date.",
+        ),
+    ]
 
     partner_id = fields.Many2one(
         "res.partner",
         string="User",
         required=True,
+        index=True,
         domain="[('category_id.name', '=', 'Test Users')]",
         options={"no_create": True, "no_open": True},
         help="Person who borrowed the book. Only partners from 'Test Users' category.",
@@ -25,12 +50,86 @@ class LibraryRent(models.Model):
         "library.book",
         string="Book",
         required=True,
+        index=True,  # Rent history lookups; open rents use library_rent_one_open
         domain="[('is_available', '=', True)]",
         options={"no_create": True, "no_open": True},
     )
     rent_date = fields.Date(string="Rent Date", default=fields.Date.today)
     return_date = fields.Date(string="Return Date")
 
+    @api.model
+    def create_batch(self, vals_list: list[dict[str, Any]]) -> "LibraryRent":
+        """
+        Creates many rents at once (e.g. imports or mass renting).
+
+        Books that already have an open rent, or appear in several open rents
+        of the batch, are detected up front with one grouped query, then all
+        records are inserted through a single list-mode create().
+        """
+
+        open_book_counts = Counter(
+            vals["book_id"] for vals in vals_list if not vals.get("return_date")
+        )
+        if open_book_counts:
+            groups = self._read_group(
+                domain=[
+                    ("book_id", "in", list(open_book_counts)),
+                    ("return_date", "=", False),
+                ],
+                groupby=["book_id"],
+            )
+            rented_ids = {book.id for [book] in groups}
+            rented_ids |= {
+                book_id for book_id, count in open_book_counts.items() if count > 1
+            }
+            if rented_ids:
+                rented_books = self.env["library.book"].browse(rented_ids)
+                raise ValidationError(
+                    "These books are already rented and not returned: "
+                    + ", ".join(rented_books.mapped("name"))
+                )
+
+        return self.create(vals_list)
+
+    @api.model
+    def _bulk_load(self, rows: list[tuple[Any, ...]]) -> "LibraryRent":
+        """
+        Inserts many historical rents in a single round-trip, bypassing the ORM
+        (data migrations, large imports).
+
+        Each row is (partner_id, book_id, rent_date, return_date). Python
+        constraints are not run: integrity relies on the DB-level unique index
+        and CHECK constraint, whose violations still raise ValidationError.
+        Stored availability fields of the affected books are refreshed in SQL.
+        """
+
+        if not rows:
+            return self.browse()
+
+        self.flush_model()
+        uid = self.env.uid
+        with self._db_constraint_as_validation_error():
+            ids = execute_values(
+                self.env.cr,
+                """
+                INSERT INTO library_rent
+                    (partner_id, book_id, rent_date, return_date,
+                     create_uid, create_date, write_uid, write_date)
+                VALUES %s
+                RETURNING id
+                """,
+                [(*row, uid, uid) for row in rows],
+                template="(%s, %s, %s, %s, %s, now() AT TIME ZONE 'UTC', "
+                "%s, now() AT TIME ZONE 'UTC')",
+                page_size=len(rows),
+                fetch=True,
+            )
+
+        books = self.env["library.book"]
+        books._refresh_availability(list({row[1] for row in rows}))
+        books.invalidate_model(["rent_ids"])
+        return self.browse([rent_id for [rent_id] in ids])
+
     def action_return_book(self) -> dict[str, Any]:
         """
         Marks the rental as returned (sets return_date = today).
@@ -56,27 +155,31 @@ class LibraryRent(models.Model):
 
     @api.constrains("book_id", "return_date")
     def _check_only_one_open_rent_per_book(self) -> None:
-        """Only one active (open) rental is allowed per book at any time."""
-
-        for record in self:
-            if record.return_date:
-                continue  # Already returned - skip
+        """
+        Only one active (open) rental is allowed per book at any time.
+        Books with several open rents are found with one grouped query
+        (HAVING count > 1), then a single error is raised.
+        """
 
-            other_open = self.search(
-                [
-                    ("book_id", "=", record.book_id.id),
-                    ("return_date", "=", False),
-                    ("id", "!=", record.id),
-                ],
-                limit=1,
+        open_rents = self.filtered(lambda r: not r.return_date)
+        if not open_rents:
+            return
+
+        groups = self._read_group(
+            domain=[
+                ("book_id", "in", open_rents.book_id.ids),
+                ("return_date", "=", False),
+            ],
+            groupby=["book_id"],
+            having=[("__count", ">", 1)],
+        )
+        if groups:
+            book = groups[0][0]
+            raise ValidationError(
+                f"This book is already rented and not returned "
+                f"(current renter: {book.current_renter_id.name or 'unknown'})."
             )
 
-            if other_open:
-                raise ValidationError(
-                    f"This book is already rented and not returned "
-                    f"(current renter: {record.book_id.current_renter_id.name or 'unknown'})."
-                )
-
     @api.constrains("rent_date", "return_date")
     def _check_rent_dates_validity(self) -> None:
         """
@@ -84,15 +187,24 @@ class LibraryRent(models.Model):
         - rent_date cannot be future
         - return_date cannot be before rent_date
         - return_date cannot be in future (if set)
+
+        Also enforced by the dates_ck CHECK constraint (see _sql_constraints);
+        kept as a fallback with more specific messages.
         """
 
         today = fields.Date.today()
-        for record in self:
-            if record.rent_date > today:
-                raise ValidationError("Rent date cannot be in the future.")
-
-            if record.return_date and record.return_date < record.rent_date:
-                raise ValidationError("Return date cannot be earlier than rent date.")
-
-            if record.return_date and record.return_date > today:
-                raise ValidationError("Return date cannot be in the future.")
+        # One pass over the recordset; only the first invalid rent is inspected
+        invalid = self.filtered(
+            lambda r: (r.rent_date and r.rent_date > today)
+            or (r.return_date and r.return_date > today)
+            or (r.return_date and r.rent_date and r.return_date < r.rent_date)
+        )
+        if not invalid:
+            return
+
+        record = invalid[0]
+        if record.rent_date and record.rent_date > today:
+            raise ValidationError("Rent date cannot be in the future.")
+        if record.rent_date and record.return_date < record.rent_date:
+            raise ValidationError("Return date cannot be earlier than rent date.")
+        raise ValidationError("Return date cannot be in the future.")
@@ -4,7 +4,7 @@ from odoo.exceptions import ValidationError
 
 class LibraryRentWizard(models.TransientModel):
     """
-    Transient wizard model used to rent out a book to a user.
+    Transient wizard model used to rent out a book (or several books) to a user.
     Opens as a popup form allowing quick selection of user and book,
     then creates a library.rent record on confirmation.
     """
@@ -26,8 +26,10 @@ class LibraryRentWizard(models.TransientModel):
         Main action triggered when user clicks "Rent Book" button.
 
         Responsibilities:
-        - Creates a new library.rent record with selected user and book
-        - Sends a success notification (toast) to the current user
+        - Creates a library.rent record for the selected user and each selected
+          book (usually a single one), in one batched create
+        - Sends a success notification (toast) to the current user,
+          unless the context has notify_user=False
         - Closes the wizard popup
 
         Returns:
@@ -36,42 +38,62 @@ class LibraryRentWizard(models.TransientModel):
 
         self.ensure_one()  # Safety: make sure we are working with a single wizard record
 
-        # Retrieve the book ID from the context
-        book_id = self.env.context.get("active_id")
+        # Retrieve the book IDs from the context: the form button passes one book,
+        # the "Rent Book" action of the books list passes the whole selection
         active_model = self.env.context.get("active_model")
+        book_ids = self.env.context.get("active_ids") or [
+            self.env.context.get("active_id")
+        ]
 
-        if not book_id or active_model != "library.book":
+        if not all(book_ids) or active_model != "library.book":
             raise ValidationError(
-                "This wizard can only be opened from a book form.\n"
-                "Please click the 'Rent Book' button directly on a book record."
+                "This wizard can only be opened from books.\n"
+                "Please click the 'Rent Book' button on a book record "
+                "or use the 'Rent Book' action on selected books."
             )
 
-        book = self.env["library.book"].browse(book_id)
-        if not book.exists():
+        books = self.env["library.book"].browse(book_ids).exists()
+        if len(books) != len(set(book_ids)):
             raise ValidationError("Book not found.")
-        if not book.is_available:
+
+        # Fetch everything needed from the books in a single SELECT
+        book_rows = books.read(["name", "is_available"])
+        rented_names = [row["name"] for row in book_rows if not row["is_available"]]
+        if len(rented_names) == 1:
+            raise ValidationError(
+                f"The book '{rented_names[0]}' is already rented to another user."
+            )
+        if rented_names:
             raise ValidationError(
-                f"The book '{book.name}' is already rented to another user."
+                "These books are already rented: " + ", ".join(rented_names)
             )
 
-        # Create the rental record
+        # Create all rental records with one batched create
+        # (partner name is only needed afterwards)
         self.env["library.rent"].create(
-            {
-                "partner_id": self.partner_id.id,
-                "book_id": book.id,
-            }
+            [
+                {
+                    "partner_id": self.partner_id.id,
+                    "book_id": book_id,
+                }
+                for book_id in books.ids
+            ]
         )
 
-        # Show nice toast notification
-        self.env["bus.bus"]._sendone(
-            self.env.user.partner_id,
-            "simple_notification",
-            {
+        # Show nice toast notification; the payload is built once and handed
+        # to the bus as-is (it is serialized a single time when notifying).
+        # RPC / bulk callers can skip the bus round-trip with notify_user=False
+        if self.env.context.get("notify_user", True):
+            user_partner = self.env.user.partner_id
+            notification = {
                 "title": "Success",
-                "message": f'Book "{book.name}" has been rented to {self.partner_id.name}.',
+                "message": f'Book "{", ".join(row["name"] for row in book_rows)}" '
+                f"has been rented to {self.partner_id.name}.",
                 "type": "success",
-            },
-        )
+            }
+            self.env["bus.bus"]._sendone(
+                user_partner, "simple_notification", notification
+            )
 
         # Close the popup
         return {"type": "ir.actions.act_window_close"}
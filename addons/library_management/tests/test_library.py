@@ -2,6 +2,7 @@ from datetime import timedelta
 from odoo.tests.common import TransactionCase
 from odoo.exceptions import ValidationError
 from odoo import fields
+from odoo.tools.sql import index_exists
 
 
 class TestLibraryRent(TransactionCase):
@@ -10,10 +11,15 @@ class TestLibraryRent(TransactionCase):
 
     Includes tests for:
     - Unique book constraints (name + author)
+    - Normalized names
+    - Unique index creation on upgrade
     - Published date validation
     - Renting books
     - Single open rent per book
     - Rent and return date validations
+    - Batch rent creation
+    - Rent wizard
+    - Bulk loading of rents
     """
 
     @classmethod
@@ -22,10 +28,8 @@ class TestLibraryRent(TransactionCase):
 
         super().setUpClass()
 
-        # Create category "Test Users"
-        cls.test_category = cls.env["res.partner.category"].create(
-            {"name": "Test Users"}
-        )
+        # Category "Test Users" shipped with the module (also used by the views)
+        cls.test_category = cls.env.ref("library_management.tag_test_users")
 
         # Create a test user and assign to category
         cls.user = cls.env["res.partner"].create(
@@ -57,6 +61,18 @@ class TestLibraryRent(TransactionCase):
                 }
             )
 
+    def test_unique_book_name_author_batch_write(self):
+        """
+        Ensure that giving several books of the same author one title is rejected.
+        """
+
+        other_book = self.env["library.book"].create(
+            {"name": "Clean Code", "author_id": self.author_robert.id}
+        )
+
+        with self.assertRaises(ValidationError):
+            (self.book | other_book).write({"name": "The Clean Coder"})
+
     def test_book_published_date_not_future(self):
         """
         Ensure that a book's published date cannot be set in the future.
@@ -205,12 +221,62 @@ class TestLibraryRent(TransactionCase):
         with self.assertRaises(ValidationError):
             self.env["library.author"].create({"name": "  jane austen  "})
 
+        # Tabs and newlines are stripped like spaces
+        with self.assertRaises(ValidationError):
+            self.env["library.author"].create({"name": "Jane Austen\t"})
+        with self.assertRaises(ValidationError):
+            self.env["library.author"].create({"name": "\nJane Austen"})
+
+    def test_name_norm(self):
+        """Check that the normalized name is stored stripped and lowercased,
+        and follows name changes."""
+
+        author = self.env["library.author"].create({"name": "  Jane AUSTEN "})
+        self.assertEqual(author.name_norm, "jane austen")
+
+        self.book.write({"name": " Clean CODE"})
+        self.assertEqual(self.book.name_norm, "clean code")
+        self.assertEqual(
+            self.env["library.book"].search([("name_norm", "=", "clean code")]),
+            self.book,
+        )
+
     def test_author_name_too_short(self):
         """Name shorter than 2 chars after stripping should raise ValidationError."""
 
         with self.assertRaises(ValidationError):
             self.env["library.author"].create({"name": "A"})
 
+        # Tabs and newlines do not count towards the length
+        with self.assertRaises(ValidationError):
+            self.env["library.author"].create({"name": "\tA\n"})
+
+    def test_unique_index_upgrade_with_duplicates(self):
+        """Check that the upgrade computes name_norm before building the unique
+        index, so existing duplicates only log a warning."""
+
+        authors = self.env["library.author"].create(
+            [{"name": "Jane Austen"}, {"name": "Emma Woodhouse"}]
+        )
+        # State right after an upgrade adding name_norm: column not computed yet,
+        # index missing, and a name differing only by surrounding whitespace
+        self.env.cr.execute("DROP INDEX library_author_name_norm_uidx")
+        self.env.cr.execute(
+            "UPDATE library_author SET name = %s WHERE id = %s",
+            [" Jane Austen ", authors[1].id],
+        )
+        self.env.cr.execute("UPDATE library_author SET name_norm = NULL")
+        self.env.invalidate_all()
+
+        with self.assertLogs(
+            "odoo.addons.library_management.models.library_constraint_mixin",
+            "WARNING",
+        ):
+            self.env["library.author"].init()
+
+        self.assertFalse(index_exists(self.env.cr, "library_author_name_norm_uidx"))
+        self.assertEqual(authors.mapped("name_norm"), ["jane austen", "jane austen"])
+
     def test_author_name_too_long_db_enforced(self):
         """Check that name >100 chars is truncated by ORM/DB, no exception raised."""
 
@@ -250,3 +316,113 @@ class TestLibraryRent(TransactionCase):
         # After creation, name should be truncated
         self.assertEqual(len(book.name), 50)
         self.assertEqual(book.name, "A" * 50)
+
+    def test_create_batch_rents(self):
+        """Rents created in batch make every rented book unavailable."""
+
+        second_book = self.env["library.book"].create(
+            {
+                "name": "Clean Code",
+                "author_id": self.author_robert.id,
+            }
+        )
+
+        rents = self.env["library.rent"].create_batch(
+            [
+                {"partner_id": self.user.id, "book_id": self.book.id},
+                {"partner_id": self.user.id, "book_id": second_book.id},
+            ]
+        )
+
+        self.assertEqual(len(rents), 2)
+        self.assertFalse(self.book.is_available)
+        self.assertFalse(second_book.is_available)
+
+    def test_create_batch_rejects_rented_books(self):
+        """Batch creation fails for books that are already (or doubly) rented."""
+
+        self.env["library.rent"].create(
+            {
+                "partner_id": self.user.id,
+                "book_id": self.book.id,
+            }
+        )
+
+        with self.assertRaises(ValidationError):
+            self.env["library.rent"].create_batch(
+                [{"partner_id": self.user.id, "book_id": self.book.id}]
+            )
+
+    def test_rent_wizard_multiple_books(self):
+        """The rent wizard rents every selected book to the chosen user."""
+
+        second_book = self.env["library.book"].create(
+            {
+                "name": "Clean Code",
+                "author_id": self.author_robert.id,
+            }
+        )
+
+        wizard = (
+            self.env["library.rent.wizard"]
+            .with_context(
+                active_model="library.book",
+                active_ids=[self.book.id, second_book.id],
+                notify_user=False,
+            )
+            .create({"partner_id": self.user.id})
+        )
+        wizard.action_rent_book()
+
+        self.assertEqual(self.book.current_renter_id, self.user)
+        self.assertEqual(second_book.current_renter_id, self.user)
+
+    def test_rent_wizard_rejects_rented_books(self):
+        """The rent wizard rents nothing when a selected book is already rented."""
+
+        second_book = self.env["library.book"].create(
+            {
+                "name": "Clean Code",
+                "author_id": self.author_robert.id,
+            }
+        )
+        self.env["library.rent"].create(
+            {"partner_id": self.user.id, "book_id": self.book.id}
+        )
+
+        wizard = (
+            self.env["library.rent.wizard"]
+            .with_context(
+                active_model="library.book",
+                active_ids=[self.book.id, second_book.id],
+                notify_user=False,
+            )
+            .create({"partner_id": self.user.id})
+        )
+        with self.assertRaisesRegex(ValidationError, "Clean Architecture"):
+            wizard.action_rent_book()
+
+        self.assertTrue(second_book.is_available)
+
+    def test_bulk_load_rents(self):
+        """Bulk-loaded rents update availability and the current renter."""
+
+        today = fields.Date.today()
+        second_book = self.env["library.book"].create(
+            {
+                "name": "Clean Code",
+                "author_id": self.author_robert.id,
+            }
+        )
+
+        rents = self.env["library.rent"]._bulk_load(
+            [
+                (self.user.id, self.book.id, today - timedelta(days=10), today),
+                (self.user.id, second_book.id, today, None),
+            ]
+        )
+
+        self.assertEqual(len(rents), 2)
+        self.assertTrue(self.book.is_available)
+        self.assertFalse(second_book.is_available)
+        self.assertEqual(second_book.current_renter_id, self.user)